@@ -2,6 +2,7 @@
 Functions for notifying different platforms and services.
 """
 
+import functools
 import logging
 import os
 import shutil
@@ -76,6 +77,28 @@ def _get_github_token() -> str | None:
     return None
 
 
+@functools.cache
+def _github_client() -> Github:
+    """
+    Get the GitHub client shared by all actions, so the token is looked up once and its connections are reused.
+    """
+    # Get GitHub token from multiple sources
+    logger.debug("Getting GitHub authentication token")
+    github_token = _get_github_token()
+    if not github_token:
+        logger.error("GitHub authentication failed - no token found")
+        raise RuntimeError(
+            "GitHub authentication required. Please ensure one of the following:\n"
+            "1. Set GITHUB_TOKEN environment variable\n"
+            "2. Configure git credentials for github.com\n"
+            "3. Login with GitHub CLI (`gh auth login`)"
+        )
+
+    # Initialize GitHub client
+    logger.debug("Initializing GitHub client")
+    return Github(github_token)
+
+
 def parse_pr_url(pr_url: str) -> tuple[str, str, str]:
     # Parse PR URL to get owner, repo, and PR number
     logger.debug(f"Parsing PR URL: {pr_url}")
@@ -100,21 +123,7 @@ def add_comment(history: History, pr_url: str, description: str, user_or_group:
 
     owner, repo, pr_number = parse_pr_url(pr_url)
 
-    # Get GitHub token from multiple sources
-    logger.debug("Getting GitHub authentication token")
-    github_token = _get_github_token()
-    if not github_token:
-        logger.error("GitHub authentication failed - no token found")
-        raise RuntimeError(
-            "GitHub authentication required. Please ensure one of the following:\n"
-            "1. Set GITHUB_TOKEN environment variable\n"
-            "2. Configure git credentials for github.com\n"
-            "3. Login with GitHub CLI (`gh auth login`)"
-        )
-
-    # Initialize GitHub client
-    logger.debug("Initializing GitHub client")
-    gh = Github(github_token)
+    gh = _github_client()
 
     try:
         # Get repository and PR
@@ -166,21 +175,7 @@ def add_reviewer(history: History, pr_url: str, user_or_group: str) -> None:
 
     owner, repo, pr_number = parse_pr_url(pr_url)
 
-    # Get GitHub token from multiple sources
-    logger.debug("Getting GitHub authentication token")
-    github_token = _get_github_token()
-    if not github_token:
-        logger.error("GitHub authentication failed - no token found")
-        raise RuntimeError(
-            "GitHub authentication required. Please ensure one of the following:\n"
-            "1. Set GITHUB_TOKEN environment variable\n"
-            "2. Configure git credentials for github.com\n"
-            "3. Login with GitHub CLI (`gh auth login`)"
-        )
-
-    # Initialize GitHub client
-    logger.debug("Initializing GitHub client")
-    gh = Github(github_token)
+    gh = _github_client()
 
     try:
         # Get repository and PR
@@ -8,6 +8,9 @@ from fraim.core.contextuals.contextual import Contextual
 class CodeChunk(Contextual[str]):
     """Concrete implementation of Contextual for code snippets"""
 
+    # A chunk is created for every piece of every scanned file, so skip the per-instance __dict__.
+    __slots__ = ("content", "file_path", "line_number_end_inclusive", "line_number_start_inclusive")
+
     def __init__(self, file_path: str, content: str, line_number_start_inclusive: int, line_number_end_inclusive: int):
         self.content = content
         self.file_path = file_path
@@ -13,6 +13,9 @@ class Contextual(Protocol, Generic[T]):
     can be included to help the LLM better understand the content.
     """
 
+    # Empty, so that implementations can opt into __slots__.
+    __slots__ = ()
+
     description: str
     content: T
 
@@ -26,7 +26,7 @@ class ProgressPanel:
         >>> console.print(panel)  # Displays progress panel
     """
 
-    def __init__(self, get_progress: Callable[[], tuple[str, int, int]]) -> None:
+    def __init__(self, get_progress: Callable[[], tuple[str, int, int | None]]) -> None:
         """
         Initialize the ProgressPanel with a progress information callback.
 
@@ -35,7 +35,8 @@ class ProgressPanel:
                          as a tuple of (description, completed, total).
                          - description (str): Text describing the current task
                          - completed (int): Number of completed items
-                         - total (int): Total number of items to process
+                         - total (int | None): Total number of items to process, or None while it is
+                           not yet known, in which case the progress bar pulses.
 
         The get_progress function will be called each time the panel is rendered
         to get the most up-to-date progress information.
@@ -47,13 +48,15 @@ class ProgressPanel:
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[green]{task.description}"),
-            TextColumn("{task.completed}/{task.total} ({task.percentage:>0.0f}%) complete"),
+            TextColumn("{task.fields[status]}"),
             BarColumn(bar_width=None),
             TimeElapsedColumn(),
             expand=True,
         )
 
-        self.task = self.progress.add_task(description, total=total, completed=completed)
+        self.task = self.progress.add_task(
+            description, total=total, completed=completed, status=_status(completed, total)
+        )
 
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         """
@@ -72,6 +75,15 @@ class ProgressPanel:
         """
         description, completed, total = self.get_progress()
 
-        self.progress.update(self.task, completed=completed, total=total, description=description)
+        self.progress.update(
+            self.task, completed=completed, total=total, description=description, status=_status(completed, total)
+        )
 
         yield Panel(self.progress, title="Progress", border_style="cyan")
+
+
+def _status(completed: int, total: int | None) -> str:
+    if total is None:
+        return f"{completed}/? complete"
+    percentage = completed / total * 100 if total else 0
+    return f"{completed}/{total} ({percentage:>0.0f}%) complete"
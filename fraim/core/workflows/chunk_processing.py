@@ -69,9 +69,10 @@ class ChunkProcessor(Generic[T]):
     def __init__(self, args: ChunkProcessingOptions) -> None:
         super().__init__(args)  # type: ignore
 
-        # Progress tracking attributes
-        self._total_chunks = 0
-        self._processed_chunks = 0
+        # Progress tracking attributes, counted in files. The total is None if the project can't count its files
+        # before they are read.
+        self._total_files: int | None = None
+        self._processed_files = 0
         self._results: list[T] = []
         self._progress: Progress | None = None
         self._progress_task: TaskID | None = None
@@ -107,7 +108,7 @@ class ChunkProcessor(Generic[T]):
         """
         Create a rich display layout showing:
         - Base class rich_display in the upper panel
-        - Progress bar showing percentage of chunks processed
+        - Progress bar showing percentage of files processed
         - Panel showing number of results found so far
         """
         # Get the base class display - since workflows inherit from Workflow class,
@@ -119,7 +120,7 @@ class ChunkProcessor(Generic[T]):
         layout.split_column(
             Layout(base_display, name="history", ratio=1),
             Layout(
-                ProgressPanel(lambda: ("Analyzing chunks", self._processed_chunks, self._total_chunks)),
+                ProgressPanel(lambda: ("Analyzing files", self._processed_files, self._total_files)),
                 name="progress",
                 size=3,
             ),
@@ -149,11 +150,22 @@ class ChunkProcessor(Generic[T]):
         Returns:
             Combined results from all chunks
         """
-        # Initialize progress tracking
-        chunks_list = list(project)
-        self._total_chunks = len(chunks_list)
-        self._processed_chunks = 0
+        # Initialize progress tracking. Progress is counted in files rather than chunks, since the files can be
+        # counted without reading them, while the chunks are only known once every file has been read.
+        self._total_files = None  # Not known until the files have been counted
+        self._processed_files = 0
         self._results = []
+        self._total_files = await asyncio.to_thread(project.file_count)
+
+        # The number of chunks of each file that are still being analyzed, plus one while the file is still being
+        # read. A file is processed once the count drops to zero.
+        unfinished_chunks: dict[str, int] = {}
+
+        def release(file_path: str) -> None:
+            unfinished_chunks[file_path] -= 1
+            if unfinished_chunks[file_path] == 0:
+                del unfinished_chunks[file_path]
+                self._processed_files += 1
 
         # Create semaphore to limit concurrent chunk processing
         semaphore = asyncio.Semaphore(max_concurrent_chunks)
@@ -175,22 +187,51 @@ class ChunkProcessor(Generic[T]):
                 if chunk_results and on_result:
                     await on_result(history, chunk_results, self._results)
 
-                self._processed_chunks += 1
+                release(chunk.file_path)
 
                 return chunk_results
 
-        # Process chunks concurrently
+        # Process chunks concurrently, pulling them from the project lazily so that analysis starts
+        # while the remaining files are still being read, without holding every chunk in memory.
         active_tasks: set[asyncio.Task] = set()
-
-        for chunk in chunks_list:
-            # Create task for this chunk and add to active tasks
-            # Note: We create the history record INSIDE the task, after acquiring the semaphore
-            task = asyncio.create_task(process_chunk_with_semaphore(history, chunk))
-            active_tasks.add(task)
-
-            # If we've hit our concurrency limit, wait for some tasks to complete
-            if len(active_tasks) >= max_concurrent_chunks:
-                _done, active_tasks = await asyncio.wait(active_tasks, return_when=asyncio.FIRST_COMPLETED)
+        chunks = iter(project)
+        reading_file: str | None = None
+        files_read = 0
+
+        try:
+            # Read each chunk on a worker thread, so that reading the files doesn't block the event loop while the
+            # chunks already read are being analyzed.
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                # The chunks of a file are read one after another, so a new path means the last file has been read.
+                if chunk.file_path != reading_file:
+                    if reading_file is not None:
+                        release(reading_file)
+                    reading_file = chunk.file_path
+                    unfinished_chunks[reading_file] = 1
+                    files_read += 1
+                unfinished_chunks[reading_file] += 1
+
+                # Create task for this chunk and add to active tasks
+                # Note: We create the history record INSIDE the task, after acquiring the semaphore
+                task = asyncio.create_task(process_chunk_with_semaphore(history, chunk))
+                active_tasks.add(task)
+
+                # If we've hit our concurrency limit, wait for some tasks to complete
+                if len(active_tasks) >= max_concurrent_chunks:
+                    _done, active_tasks = await asyncio.wait(active_tasks, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # Reading the project failed, e.g. a file could not be read. Don't leave the chunks already being
+            # processed running in the background.
+            for task in active_tasks:
+                task.cancel()
+            await asyncio.gather(*active_tasks, return_exceptions=True)
+            raise
+
+        if reading_file is not None:
+            release(reading_file)
+        # The count may include files that yield no chunks, e.g. files that can't be decoded, so now that every file
+        # has been read, use the number of files that were.
+        self._total_files = files_read
 
         # Wait for any remaining tasks to complete
         await asyncio.gather(*active_tasks)
@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+# Tests for core.workflows modules
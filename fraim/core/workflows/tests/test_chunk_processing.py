@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+"""Tests for concurrent chunk processing"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from fraim.core.contextuals import CodeChunk
+from fraim.core.history import History
+from fraim.core.workflows.chunk_processing import ChunkProcessingOptions, ChunkProcessor
+from fraim.inputs.project import ProjectInput
+
+
+class Workflow:
+    def __init__(self, args: Any) -> None:
+        self.args = args
+
+
+class Processor(ChunkProcessor[str], Workflow):
+    @property
+    def file_patterns(self) -> list[str]:
+        return ["*.py"]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> ProjectInput:
+    """Create a project of three files, one of which is split into three chunks."""
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("".join(f"b{i} = {i}\n" for i in range(25)))
+    (tmp_path / "c.py").write_text("c = 3\n")
+    kwargs = SimpleNamespace(
+        location=str(tmp_path), globs=["*.py"], limit=None, chunk_size=10, head=None, base=None, diff=False
+    )
+    return ProjectInput(kwargs=kwargs)
+
+
+class TestChunkProcessor:
+    """Test cases for ChunkProcessor"""
+
+    async def test_progress_total_is_known_while_chunks_are_processed(self, project: ProjectInput) -> None:
+        """Test that the files are counted before any chunk is analyzed, and that every file is processed"""
+        processor = Processor(ChunkProcessingOptions())
+        progress = []
+
+        async def process(history: History, chunk: CodeChunk) -> list[str]:
+            progress.append((processor._processed_files, processor._total_files))
+            return [chunk.file_path]
+
+        results = await processor.process_chunks_concurrently(History(), project, process, max_concurrent_chunks=2)
+
+        assert sorted(results) == ["a.py", "b.py", "b.py", "b.py", "c.py"]
+        assert all(total == 3 for _processed, total in progress)
+        assert (processor._processed_files, processor._total_files) == (3, 3)
+
+    async def test_progress_total_excludes_files_without_chunks(self, project: ProjectInput) -> None:
+        """Test that a file that can't be decoded is counted up front, but not in the final total"""
+        (Path(project.project_path) / "binary.py").write_bytes(b"\xff\xfe\x00\x80")
+        processor = Processor(ChunkProcessingOptions())
+        totals = []
+
+        async def process(history: History, chunk: CodeChunk) -> list[str]:
+            totals.append(processor._total_files)
+            return []
+
+        await processor.process_chunks_concurrently(History(), project, process)
+
+        assert totals[0] == 4
+        assert (processor._processed_files, processor._total_files) == (3, 3)
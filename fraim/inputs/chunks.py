@@ -10,15 +10,21 @@ from fraim.inputs.file import BufferedFile
 # TODO: move chunking concern out of input
 def chunk_input(file: BufferedFile, chunk_size: int) -> Iterator[CodeChunk]:
     """Split file content into chunks with line numbers."""
-    lines = file.body.split("\n")
-
-    # If file is small enough, just process it as a single chunk
-    if len(lines) <= chunk_size:
-        yield CodeChunk(file.path, file.body, 1, len(lines) - 1)
+    # If file is small enough, just process it as a single chunk. Counting newlines is much cheaper
+    # than splitting the body into lines, and most files fit in a single chunk.
+    newline_count = file.body.count("\n")
+    if newline_count < chunk_size:
+        # A trailing newline terminates the last line rather than starting a new one.
+        line_count = newline_count if file.body.endswith("\n") else newline_count + 1
+        yield CodeChunk(file.path, file.body, 1, line_count)
         return
 
+    lines = file.body.split("\n")
+    # As above, a trailing newline doesn't start another line.
+    line_count = len(lines) - 1 if file.body.endswith("\n") else len(lines)
+
     # Create chunks at logical boundaries
-    for i in range(0, len(lines), chunk_size):
+    for i in range(0, line_count, chunk_size):
         chunk_start = i
 
         # If we're not at the beginning, try to find a better starting point
@@ -54,16 +60,16 @@ def chunk_input(file: BufferedFile, chunk_size: int) -> Iterator[CodeChunk]:
                     # Include at least 3 more lines after the continuation
                     chunk_end = min(len(lines), continuation_end + 3)
 
-        chunk_content = "\n".join(lines[chunk_start:chunk_end])
-        numbered_content = prepend_line_numbers_to_snippet(chunk_content)
-        yield CodeChunk(file.path, numbered_content, chunk_start, chunk_end)
+        # Number the lines straight from the slice, rather than joining them only to split them again.
+        numbered_content = _number_lines(lines[chunk_start:chunk_end])
+        # `chunk_start` and `chunk_end` are a 0-based, exclusive slice; the chunk reports 1-based, inclusive lines.
+        yield CodeChunk(file.path, numbered_content, chunk_start + 1, min(chunk_end, line_count))
 
 
 def prepend_line_numbers_to_snippet(snippet: str) -> str:
     # Add line numbers to the code snippet
-    numbered_lines = []
-    for i, line in enumerate(snippet.split("\n"), 1):
-        numbered_lines.append(f"{i:3d}: {line}")
+    return _number_lines(snippet.split("\n"))
+
 
-    joined_lines = "\n".join(numbered_lines)
-    return joined_lines
+def _number_lines(lines: list[str]) -> str:
+    return "\n".join([f"{i:3d}: {line}" for i, line in enumerate(lines, 1)])
@@ -3,6 +3,8 @@
 
 
 class BufferedFile:
+    __slots__ = ("body", "path")
+
     def __init__(self, path: str, body: str):
         self.path = path
         self.body = body
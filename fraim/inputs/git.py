@@ -41,13 +41,20 @@ class GitRemote(Input):
     ) -> None:
         self.tempdir.cleanup()
 
+    def file_count(self) -> int:
+        """Count the files that will be scanned, cloning the repository first if needed."""
+        self._clone_to_path()
+        return self._local().file_count()
+
     def __iter__(self) -> Iterator[CodeChunk]:
         logger.debug("Starting git repository input iterator")
 
         # Clone remote repository to a local directory, delegate to file iterator.
         self._clone_to_path()
-        for chunk in Local(path=self.path, chunk_size=self.chunk_size, globs=self.globs, limit=self.limit):
-            yield chunk
+        yield from self._local()
+
+    def _local(self) -> Local:
+        return Local(path=self.path, chunk_size=self.chunk_size, globs=self.globs, limit=self.limit)
 
     def _clone_to_path(self) -> None:
         if not _is_directory_empty(self.path):
@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Resourcely Inc.
-from collections.abc import Iterator
+import io
+import logging
+import subprocess
+import tempfile
+from collections.abc import Iterable, Iterator
 from types import TracebackType
 
-from git import Repo
-from unidiff import PatchSet
+from unidiff import PatchedFile, PatchSet
 
 from fraim.core.contextuals import CodeChunk
 from fraim.inputs.input import Input
 
+logger = logging.getLogger(__name__)
+
 
 # TODO: Git remote input? Wrap git input?
 class GitDiff(Input):
@@ -40,21 +45,48 @@ class GitDiff(Input):
     def root_path(self) -> str:
         return self.path
 
-    def _git_repo(self) -> Repo:
-        return Repo(self.path)
+    def file_count(self) -> int:
+        """Count the changed files, without reading their diffs."""
+        args = self._git_diff_args("--name-only", "-z")
+        result = subprocess.run(args, check=False, capture_output=True, stdin=subprocess.DEVNULL)
+
+        if result.returncode != 0:
+            error = result.stderr.decode(errors="replace")
+            logger.error(f"Git diff failed: {error}")
+            raise subprocess.CalledProcessError(result.returncode, args, stderr=error)
+        # Each path is terminated by a NUL, so that paths containing newlines are counted once.
+        return result.stdout.count(b"\0")
+
+    def _git_diff_args(self, *options: str) -> list[str]:
+        revisions = [rev for rev in (self.base, self.head) if rev is not None]
+        return ["git", "-C", self.path, "diff", *options, *revisions]
 
-    # TODO: Can we iterate repo.git.diff directly?
-    def _git_diff(self, repo: Repo) -> str:
-        return str(repo.git.diff(self.base, self.head))
+    def _git_diff(self) -> Iterator[str]:
+        """Stream the lines of `git diff` from the git process, rather than reading the whole diff into memory."""
+        args = self._git_diff_args("--no-color")
+        # stderr goes to a file rather than a pipe: it is only read once stdout is exhausted, and git would block on a
+        # full stderr pipe (e.g. with a warning per file) before it finished writing stdout.
+        with tempfile.TemporaryFile() as stderr:
+            with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=stderr, stdin=subprocess.DEVNULL) as process:
+                assert process.stdout is not None  # We used PIPE, so this is guaranteed
+                # Split on "\n" only, like git, so that "\r" in changed lines is kept as content.
+                with io.TextIOWrapper(
+                    process.stdout, encoding="utf-8", errors="surrogateescape", newline="\n"
+                ) as lines:
+                    yield from lines
+
+            if process.returncode != 0:
+                stderr.seek(0)
+                error = stderr.read().decode(errors="replace")
+                logger.error(f"Git diff failed: {error}")
+                raise subprocess.CalledProcessError(process.returncode, args, stderr=error)
 
     def __iter__(self) -> Iterator[CodeChunk]:
-        repo = self._git_repo()
-        diff = self._git_diff(repo)
+        diff = self._git_diff()
 
-        # Parse the diff output
+        # Parse the diff output one file at a time, so only a single file's patch is held in memory.
         # TODO: could we use the entire file's unified diff as the chunk?
-        patch_set = PatchSet(diff)
-        for patched_file in patch_set:
+        for patched_file in _patched_files(diff):
             for hunk in patched_file:
                 unified = str(hunk)
                 line_start_incl = hunk.target_start  # TODO: implement this correctly
@@ -66,3 +98,16 @@ class GitDiff(Input):
                     line_number_start_inclusive=line_start_incl,
                     line_number_end_inclusive=line_end_incl,
                 )
+
+
+def _patched_files(diff: Iterable[str]) -> Iterator[PatchedFile]:
+    """Parse a `git diff`, yielding each file's patch as soon as all of its lines have been read."""
+    lines: list[str] = []
+    for line in diff:
+        # Hunk lines always start with a prefix (" ", "+", "-" or "\\"), so this can only be a file header.
+        if line.startswith("diff --git ") and lines:
+            yield from PatchSet(lines)
+            lines = []
+        lines.append(line)
+    if lines:
+        yield from PatchSet(lines)
@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Resourcely Inc.
+import fnmatch
 import logging
 import os.path
+import re
+from collections import deque
 from collections.abc import Iterator
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import TracebackType
 from typing import Self
 
@@ -16,6 +19,17 @@ from fraim.inputs.input import Input
 
 logger = logging.getLogger(__name__)
 
+# Number of threads reading files, and the number of files that may be read ahead of the one being chunked.
+_READ_WORKERS = 8
+_READ_AHEAD = 16
+
+# The .gitignore specs that apply to a directory, from the scanned root down, each with the length of the relative
+# path of the directory containing the .gitignore.
+_IgnoreSpecs = tuple[tuple[int, pathspec.PathSpec], ...]
+
+# A glob with separators, compiled to a pattern per path component, with None for a recursive `**` component.
+_PathGlob = tuple[re.Pattern[str] | None, ...]
+
 
 class Local(Input):
     def __init__(self, path: str, chunk_size: int, globs: list[str] | None = None, limit: int | None = None):
@@ -45,6 +59,13 @@ class Local(Input):
         )
         self.limit = limit
         self.chunk_size = chunk_size
+        # Compile the globs once. Globs without a separator only need to match the file name, so they are combined
+        # into a single pattern.
+        name_globs = [glob for glob in self.globs if "/" not in glob]
+        self._name_pattern = (
+            re.compile("|".join(fnmatch.translate(glob) for glob in name_globs)) if name_globs else None
+        )
+        self._path_globs = [_compile_path_glob(glob) for glob in self.globs if "/" in glob]
 
     def root_path(self) -> str:
         return self.path
@@ -52,46 +73,94 @@ class Local(Input):
     def __iter__(self) -> Iterator[CodeChunk]:
         logger.info(f"Scanning local files: {self.path}, with globs: {self.globs}")
 
-        # Load .gitignore patterns if present
-        gitignore_spec = None
-        gitignore_file = Path(self.path) / ".gitignore"
-        if gitignore_file.exists():
-            with gitignore_file.open() as f:
-                gitignore_spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
-
-        seen = set()
-        for glob_pattern in self.globs:
-            for path in Path(self.path).rglob(glob_pattern):
-                # Skip file if not a file
-                if not path.is_file():
-                    continue
-                # Skip file if already seen
-                if path in seen:
-                    continue
-                # Skip git-ignored file
-                # TODO: skipping here still requires the `rglob` step to iterate every file. Replace with a
-                #       custom walk function that can skip entire branches.
-                if gitignore_spec and gitignore_spec.match_file(path.relative_to(self.path).as_posix()):
-                    continue
-                try:
-                    logger.info(f"Reading file: {path}")
-                    # TODO: Avoid reading files that are too large?
-                    file = BufferedFile(os.path.relpath(path, self.root_path()), path.read_text(encoding="utf-8"))
-
-                    for chunk in chunk_input(file, self.chunk_size):
-                        yield chunk
-
-                    # Add file to set of seen files, exit early if maximum reached.
-                    seen.add(path)
-                    if self.limit is not None and len(seen) == self.limit:
-                        return
-
-                except Exception as e:
-                    if isinstance(e, UnicodeDecodeError):
-                        logger.warning(f"Skipping file with encoding issues: {path}")
+        files_read = 0
+        for relative_path, body in self._read_files():
+            # Skip file that could not be decoded
+            if body is None:
+                continue
+
+            yield from chunk_input(BufferedFile(relative_path, body), self.chunk_size)
+
+            # Exit early if maximum reached.
+            files_read += 1
+            if self.limit is not None and files_read == self.limit:
+                return
+
+    def file_count(self) -> int:
+        """Count the files that will be scanned, without reading them."""
+        count = sum(1 for _ in self._files())
+        return min(count, self.limit) if self.limit else count
+
+    def _files(self) -> Iterator[tuple[str, str]]:
+        """Yield each file to scan, with its path relative to the scanned directory."""
+        # Walk the tree once for all globs, rather than once per glob, so that git-ignored directories can be
+        # skipped without descending into them. Each directory carries its path relative to the scanned directory, and
+        # the .gitignore specs that apply to it.
+        directories: list[tuple[str, str, _IgnoreSpecs]] = [(self.path, "", ())]
+        while directories:
+            directory, relative_directory, ignore_specs = directories.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except PermissionError:
+                logger.warning(f"Skipping directory without read permission: {directory}")
+                continue
+
+            # Load .gitignore patterns if present
+            for entry in entries:
+                if entry.name == ".gitignore" and entry.is_file():
+                    with open(entry.path) as f:
+                        spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
+                    ignore_specs = (*ignore_specs, (len(relative_directory), spec))
+                    break
+
+            for entry in entries:
+                relative_path = relative_directory + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip git metadata and git-ignored directory
+                    if entry.name == ".git" or _is_ignored(ignore_specs, relative_path + "/"):
+                        continue
+                    directories.append((entry.path, relative_path + "/", ignore_specs))
+                # Skip file if not matched by any glob, or not a file. The name is matched first, since is_file()
+                # may need a stat call, e.g. for a symlink.
+                elif self._matches_glob(entry.name, relative_path) and entry.is_file():
+                    # Skip git-ignored file
+                    if _is_ignored(ignore_specs, relative_path):
                         continue
-                    logger.error(f"Error reading file: {path} - {e}")
-                    raise e
+                    yield entry.path, relative_path
+
+    def _matches_glob(self, name: str, relative_path: str) -> bool:
+        # As with `Path.rglob`, a glob without a separator matches the file name at any depth, and a glob with
+        # separators matches the trailing components of the path, with `**` matching any number of directories.
+        if self._name_pattern is not None and self._name_pattern.match(name):
+            return True
+        if not self._path_globs:
+            return False
+        components = relative_path.split("/")
+        return any(_match_path_glob(segments, components) for segments in self._path_globs)
+
+    def _read_files(self) -> Iterator[tuple[str, str | None]]:
+        """
+        Read the files to scan on a thread pool, yielding `(relative_path, body)` in discovery order.
+
+        File reads are I/O bound, so up to `_READ_AHEAD` files are read while the caller chunks the current one.
+        With a small file limit, reading ahead is capped at the limit so that `--limit 1` reads a single file.
+        """
+        read_ahead = _READ_AHEAD if not self.limit else min(_READ_AHEAD, self.limit)
+        executor = ThreadPoolExecutor(max_workers=min(_READ_WORKERS, read_ahead), thread_name_prefix="fraim-local-read")
+        try:
+            pending: deque[tuple[str, Future[str | None]]] = deque()
+            for path, relative_path in self._files():
+                pending.append((relative_path, executor.submit(_read_text, path)))
+                if len(pending) >= read_ahead:
+                    ready_path, body = pending.popleft()
+                    yield ready_path, body.result()
+            while pending:
+                ready_path, body = pending.popleft()
+                yield ready_path, body.result()
+        finally:
+            # Don't read ahead any further if the caller stopped early, e.g. when the file limit is reached.
+            executor.shutdown(cancel_futures=True)
 
     def __enter__(self) -> Self:
         return self
@@ -100,3 +169,47 @@ class Local(Input):
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
     ) -> None:
         pass
+
+
+def _compile_path_glob(glob: str) -> _PathGlob:
+    """
+    Compile a glob with separators into one pattern per path component, with None for a `**` component.
+
+    Like `Path.rglob`, the glob is implicitly prefixed with `**/`, so that it matches wherever it occurs in the tree.
+    """
+    return (None, *(None if segment == "**" else re.compile(fnmatch.translate(segment)) for segment in glob.split("/")))
+
+
+def _match_path_glob(segments: _PathGlob, components: list[str]) -> bool:
+    """Match the components of a relative path against a compiled path glob."""
+    if not segments:
+        return not components
+    segment, rest = segments[0], segments[1:]
+    if segment is None:
+        # `**` matches zero or more components
+        return any(_match_path_glob(rest, components[i:]) for i in range(len(components) + 1))
+    return bool(components) and segment.match(components[0]) is not None and _match_path_glob(rest, components[1:])
+
+
+def _is_ignored(ignore_specs: _IgnoreSpecs, path: str) -> bool:
+    """Check whether a path is git-ignored. As in git, the patterns of the deepest .gitignore that matches win."""
+    for prefix_length, spec in reversed(ignore_specs):
+        include: bool | None = spec.check_file(path[prefix_length:]).include
+        if include is not None:
+            return include
+    return False
+
+
+def _read_text(path: str) -> str | None:
+    """Read a file as UTF-8, returning None if it cannot be decoded."""
+    try:
+        logger.debug("Reading file: %s", path)
+        # TODO: Avoid reading files that are too large?
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError:
+        logger.warning(f"Skipping file with encoding issues: {path}")
+        return None
+    except Exception as e:
+        logger.error(f"Error reading file: {path} - {e}")
+        raise
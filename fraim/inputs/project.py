@@ -11,6 +11,9 @@ from fraim.inputs.input import Input
 from fraim.inputs.local import Local
 from fraim.inputs.status_check import StatusCheck
 
+# Locations starting with one of these are cloned rather than read from disk.
+_REMOTE_PREFIXES = ("http://", "https://", "git@")
+
 
 class ProjectInput:
     input: Input
@@ -34,8 +37,8 @@ class ProjectInput:
         if path_or_url is None:
             raise ValueError("Location is required")
 
-        if path_or_url.startswith("http://") or path_or_url.startswith("https://") or path_or_url.startswith("git@"):
-            self.repo_name = path_or_url.split("/")[-1].replace(".git", "")
+        if path_or_url.startswith(_REMOTE_PREFIXES):
+            self.repo_name = path_or_url.rpartition("/")[2].removesuffix(".git")
             # TODO: git diff here?
             self.input = GitRemote(
                 url=path_or_url, globs=globs, limit=limit, prefix="fraim_scan_", chunk_size=self.chunk_size
@@ -52,12 +55,24 @@ class ProjectInput:
             else:
                 self.input = Local(self.project_path, globs=globs, limit=limit, chunk_size=self.chunk_size)
 
+    def file_count(self) -> int | None:
+        """
+        Count the files the input will yield chunks for, without reading their contents.
+
+        Returns None if the input can't count its files up front.
+        """
+        if isinstance(self.input, Local | GitDiff | GitRemote):
+            return self.input.file_count()
+        return None
+
     def __iter__(self) -> Iterator[CodeChunk]:
-        for chunk in self.input:
-            yield cast("CodeChunk", chunk)  # TODO: Remove cast when Input yields Iterator[Contextual]
+        # Hand out the input's own iterator rather than re-yielding each chunk through another generator frame.
+        return cast("Iterator[CodeChunk]", iter(self.input))  # TODO: Remove cast when Input yields Iterator[Contextual]
 
 
 class ProjectInputFileChunker:
+    __slots__ = ("chunk_size", "file", "project_path")
+
     def __init__(self, file: BufferedFile, project_path: str, chunk_size: int) -> None:
         self.file = file
         self.project_path = project_path
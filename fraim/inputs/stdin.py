@@ -19,8 +19,7 @@ class StandardInput(Input):
         return "stdin"
 
     def __iter__(self) -> Iterator[CodeChunk]:
-        for chunk in chunk_input(BufferedFile("stdin", self.body), chunk_size=128):
-            yield chunk
+        yield from chunk_input(BufferedFile("stdin", self.body), chunk_size=128)
 
     def __enter__(self) -> Self:
         return self
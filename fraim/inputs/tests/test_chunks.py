@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+"""Tests for chunking file input"""
+
+import pytest
+
+from fraim.inputs.chunks import chunk_input, prepend_line_numbers_to_snippet
+from fraim.inputs.file import BufferedFile
+
+
+class TestChunkInput:
+    """Test cases for chunk_input function"""
+
+    @pytest.mark.parametrize(
+        "body,expected_end_line",
+        [
+            ("", 1),
+            ("single line", 1),
+            ("single line\n", 1),
+            ("line 1\nline 2\nline 3", 3),
+            ("line 1\nline 2\nline 3\n", 3),
+        ],
+    )
+    def test_small_file_is_single_chunk(self, body: str, expected_end_line: int) -> None:
+        """Test that a file that fits in one chunk is yielded whole, spanning all of its lines"""
+        chunks = list(chunk_input(BufferedFile("file.py", body), chunk_size=10))
+
+        assert len(chunks) == 1
+        assert chunks[0].file_path == "file.py"
+        assert chunks[0].content == body
+        assert chunks[0].line_number_start_inclusive == 1
+        assert chunks[0].line_number_end_inclusive == expected_end_line
+
+    def test_large_file_is_split_into_numbered_chunks(self) -> None:
+        """Test that a file larger than the chunk size is split into line numbered chunks, with 1-based line ranges"""
+        body = "\n".join(f"x = {i}" for i in range(25))
+
+        chunks = list(chunk_input(BufferedFile("file.py", body), chunk_size=10))
+
+        assert len(chunks) == 3
+        assert chunks[0].content.split("\n")[0] == "  1: x = 0"
+        assert chunks[1].content.split("\n")[0] == "  1: x = 10"
+        assert [(chunk.line_number_start_inclusive, chunk.line_number_end_inclusive) for chunk in chunks] == [
+            (1, 10),
+            (11, 20),
+            (21, 25),
+        ]
+
+    @pytest.mark.parametrize("line_count", [20, 25])
+    def test_large_file_ends_on_its_last_line(self, line_count: int) -> None:
+        """Test that the last chunk of a split file ends on its last line, not after its trailing newline"""
+        body = "".join(f"x = {i}\n" for i in range(line_count))
+
+        chunks = list(chunk_input(BufferedFile("file.py", body), chunk_size=10))
+
+        assert chunks[-1].line_number_start_inclusive <= line_count
+        assert chunks[-1].line_number_end_inclusive == line_count
+
+
+def test_prepend_line_numbers_to_snippet() -> None:
+    """Test that each line of a snippet is prefixed with its line number"""
+    assert prepend_line_numbers_to_snippet("a\nb") == "  1: a\n  2: b"
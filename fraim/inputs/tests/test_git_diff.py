@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+"""Tests for git diff input"""
+
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from fraim.inputs.git_diff import GitDiff
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a repository with one commit changing two files."""
+    git(tmp_path, "init")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.py").write_text("".join(f"a{i}\n" for i in range(1, 21)))
+    (tmp_path / "b.py").write_text("b1\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-m", "base")
+    (tmp_path / "a.py").write_text("".join(f"a{i}\n" if i not in (2, 18) else "changed\n" for i in range(1, 21)))
+    (tmp_path / "b.py").write_text("b1\nb2\n")
+    git(tmp_path, "commit", "-am", "head")
+    return tmp_path
+
+
+class TestGitDiff:
+    """Test cases for GitDiff input"""
+
+    def test_yields_a_chunk_per_hunk(self, repo: Path) -> None:
+        """Test that every hunk of every file becomes a chunk with its target line range"""
+        chunks = list(GitDiff(str(repo), head="HEAD", base="HEAD~1"))
+
+        assert [
+            (chunk.file_path, chunk.line_number_start_inclusive, chunk.line_number_end_inclusive) for chunk in chunks
+        ] == [("a.py", 1, 5), ("a.py", 15, 20), ("b.py", 1, 2)]
+        assert chunks[2].content == "@@ -1,1 +1,2 @@\n b1\n+b2\n"
+
+    def test_file_count(self, repo: Path) -> None:
+        """Test that the changed files are counted without reading their diffs"""
+        (repo / "new\nline.py").write_text("n1\n")
+        git(repo, "add", ".")
+
+        assert GitDiff(str(repo), head="HEAD", base="HEAD~1").file_count() == 2
+        assert GitDiff(str(repo), head=None, base="HEAD~1").file_count() == 3
+
+    def test_raises_when_git_fails(self, repo: Path) -> None:
+        """Test that a failing git diff is an error rather than an empty diff"""
+        with pytest.raises(subprocess.CalledProcessError, match="unknown-revision") as exc_info:
+            list(GitDiff(str(repo), head="HEAD", base="unknown-revision"))
+
+        assert "unknown-revision" in exc_info.value.stderr
+
+    def test_does_not_block_on_git_warnings(self, repo: Path) -> None:
+        """Test that git writing more warnings than fit in a pipe doesn't stall the diff"""
+        names = [f"{'long_file_name_' * 8}{i}.txt" for i in range(500)]
+        for name in names:
+            (repo / name).write_text("before\n")
+        git(repo, "add", ".")
+        git(repo, "commit", "-m", "files")
+        # With autocrlf, git warns on stderr about every changed LF file in the working tree: ~100KB here.
+        git(repo, "config", "core.autocrlf", "true")
+        for name in names:
+            (repo / name).write_text("after\n")
+
+        chunk_counts: list[int] = []
+        diff = GitDiff(str(repo), head=None, base="HEAD")
+        reader = threading.Thread(target=lambda: chunk_counts.append(len(list(diff))), daemon=True)
+        reader.start()
+        reader.join(timeout=30)
+
+        assert not reader.is_alive(), "git diff blocked"
+        assert chunk_counts == [len(names)]
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+"""Tests for local file input"""
+
+import builtins
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from fraim.inputs.local import Local
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small project directory to scan."""
+    files = {
+        "main.py": "print('main')\n",
+        "README.md": "# Project\n",
+        "pkg/module.py": "x = 1\n",
+        "pkg/nested/deep.py": "y = 2\n",
+        "build/generated.py": "z = 3\n",
+        "debug.log.py": "w = 4\n",
+        ".git/hooks/hook.py": "v = 5\n",
+    }
+    for name, body in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+    (tmp_path / ".gitignore").write_text("build/\ndebug.*\n")
+    return tmp_path
+
+
+def scanned_paths(local: Local) -> list[str]:
+    return sorted(chunk.file_path for chunk in local)
+
+
+class TestLocal:
+    """Test cases for Local input"""
+
+    def test_matches_globs_at_any_depth(self, project: Path) -> None:
+        """Test that globs match file names in every directory, skipping git-ignored and .git files"""
+        local = Local(str(project), chunk_size=100, globs=["*.py"])
+
+        assert scanned_paths(local) == ["main.py", "pkg/module.py", "pkg/nested/deep.py"]
+
+    @pytest.mark.parametrize(
+        "globs,expected_paths",
+        [
+            (["nested/*.py", "README.md"], ["README.md", "pkg/nested/deep.py"]),
+            (["**/*.py"], ["main.py", "pkg/module.py", "pkg/nested/deep.py"]),
+            (["pkg/**/*.py"], ["pkg/module.py", "pkg/nested/deep.py"]),
+            (["**/nested/*.py"], ["pkg/nested/deep.py"]),
+            (["pkg/**"], ["pkg/module.py", "pkg/nested/deep.py"]),
+        ],
+    )
+    def test_matches_globs_with_separators_against_trailing_path(
+        self, project: Path, globs: list[str], expected_paths: list[str]
+    ) -> None:
+        """Test that a glob containing a separator matches the trailing components of the path, like `Path.rglob`"""
+        local = Local(str(project), chunk_size=100, globs=globs)
+
+        assert scanned_paths(local) == expected_paths
+
+    def test_applies_nested_gitignore_relative_to_its_directory(self, project: Path) -> None:
+        """Test that a nested .gitignore applies below its directory and overrides the patterns above it"""
+        (project / "pkg" / ".gitignore").write_text("/module.py\n!debug.keep.py\n")
+        (project / "pkg" / "nested" / "module.py").write_text("u = 6\n")
+        (project / "pkg" / "debug.keep.py").write_text("t = 7\n")
+        local = Local(str(project), chunk_size=100, globs=["*.py"])
+
+        assert scanned_paths(local) == ["main.py", "pkg/debug.keep.py", "pkg/nested/deep.py", "pkg/nested/module.py"]
+
+    def test_limit(self, project: Path) -> None:
+        """Test that scanning stops after the file limit is reached"""
+        local = Local(str(project), chunk_size=100, globs=["*.py"], limit=2)
+
+        assert len(scanned_paths(local)) == 2
+
+    @pytest.mark.parametrize("limit,expected_count", [(None, 3), (2, 2), (10, 3)])
+    def test_file_count(self, project: Path, limit: int | None, expected_count: int) -> None:
+        """Test that the files are counted like they are scanned, up to the limit"""
+        local = Local(str(project), chunk_size=100, globs=["*.py"], limit=limit)
+
+        assert local.file_count() == expected_count
+
+    def test_undecodable_file_is_skipped_without_counting_toward_limit(self, tmp_path: Path) -> None:
+        """Test that a file that isn't UTF-8 is skipped, and the limit is reached with the files that can be read"""
+        (tmp_path / "a.py").write_text("a = 1\n")
+        (tmp_path / "binary.py").write_bytes(b"\xff\xfe\x00\x80")
+        (tmp_path / "b.py").write_text("b = 2\n")
+        local = Local(str(tmp_path), chunk_size=100, globs=["*.py"], limit=2)
+
+        assert scanned_paths(local) == ["a.py", "b.py"]
+
+    def test_read_error_propagates_in_discovery_order(self, tmp_path: Path) -> None:
+        """Test that a file that can't be read raises after the files found before it, and stops the read threads"""
+        for i in range(40):
+            (tmp_path / f"file{i}.py").write_text(f"x = {i}\n")
+        local = Local(str(tmp_path), chunk_size=100, globs=["*.py"])
+        discovered = [relative_path for _path, relative_path in local._files()]
+        unreadable = discovered[20]
+
+        def open_or_deny(file: str, *args: Any, **kwargs: Any) -> Any:
+            if file.endswith("/" + unreadable):
+                raise PermissionError(f"Permission denied: {file}")
+            return builtins.open(file, *args, **kwargs)
+
+        paths = []
+        with (
+            patch("fraim.inputs.local.open", side_effect=open_or_deny, create=True),
+            pytest.raises(PermissionError, match=unreadable),
+        ):
+            for chunk in local:
+                paths.append(chunk.file_path)
+
+        assert paths == discovered[:20]
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("fraim-local-read")]
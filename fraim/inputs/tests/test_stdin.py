@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Resourcely Inc.
+
+"""Tests for standard input"""
+
+from fraim.inputs.stdin import StandardInput
+
+
+class TestStandardInput:
+    """Test cases for StandardInput"""
+
+    def test_end_line_is_line_count(self) -> None:
+        """Test that a multi-line body is one chunk ending on its last line, not at its character count"""
+        body = "first line\nsecond line\nthird line\n"
+
+        chunks = list(StandardInput(body))
+
+        assert len(chunks) == 1
+        assert chunks[0].file_path == "stdin"
+        assert chunks[0].content == body
+        assert chunks[0].line_number_start_inclusive == 1
+        assert chunks[0].line_number_end_inclusive == 3
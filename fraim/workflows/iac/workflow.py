@@ -99,7 +99,7 @@ class IaCWorkflow(ChunkProcessor[sarif.Result], LLMMixin, Workflow[IaCWorkflowOp
         """Process a single chunk with error handling."""
         try:
             # 1. Scan the code for vulnerabilities.
-            logger.info(f"Scanning code for vulnerabilities: {Path(chunk.file_path)}")
+            logger.info("Scanning code for vulnerabilities: %s", chunk.file_path)
             iac_input = IaCCodeChunkOptions(code=chunk)
             vulns = await self.scanner_step.run(history, iac_input)
 
@@ -11,7 +11,6 @@ This workflow addresses the Project Overview section of threat assessment questi
 import logging
 import os
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Annotated, Any
 
 from pydantic import BaseModel
@@ -211,7 +210,7 @@ class SystemAnalysisWorkflow(
     ) -> list[SystemAnalysisResult]:
         """Process a single chunk using two-step analysis: assessment then analysis."""
         try:
-            logger.debug(f"Processing chunk: {Path(chunk.file_path)}")
+            logger.debug("Processing chunk: %s", chunk.file_path)
 
             chunk_input = SystemAnalysisChunkOptions(
                 code=chunk,
@@ -238,7 +237,7 @@ class SystemAnalysisWorkflow(
                 return []
 
             # Step 2: System analysis and deduplication
-            logger.debug(f"Analyzing chunk: {Path(chunk.file_path)}")
+            logger.debug("Analyzing chunk: %s", chunk.file_path)
             result = await self.analysis_step.run(history, chunk_input)
             return [result]
 